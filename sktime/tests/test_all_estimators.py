@@ -7,11 +7,10 @@ adapted from scikit-learn's estimator_checks
 __author__ = ["mloning", "fkiraly", "achieveordie"]
 
 import numbers
-import os
 import types
 from copy import deepcopy
-from inspect import getfullargspec, isclass, signature
-from tempfile import TemporaryDirectory
+from functools import lru_cache
+from inspect import getattr_static, getfullargspec, isclass, signature
 
 import numpy as np
 import pandas as pd
@@ -19,15 +18,8 @@ import pytest
 from _pytest.outcomes import Skipped
 
 from sktime.base import BaseEstimator, BaseObject, load
-from sktime.classification.deep_learning.base import BaseDeepClassifier
-from sktime.dists_kernels.base import (
-    BasePairwiseTransformer,
-    BasePairwiseTransformerPanel,
-)
 from sktime.exceptions import NotFittedError
-from sktime.forecasting.base import BaseForecaster
 from sktime.registry import all_estimators, get_base_class_lookup, scitype
-from sktime.regression.deep_learning.base import BaseDeepRegressor
 from sktime.tests._config import (
     EXCLUDE_ESTIMATORS,
     EXCLUDED_TESTS,
@@ -51,7 +43,6 @@ from sktime.utils._testing.scenarios_getter import retrieve_scenarios
 from sktime.utils.deep_equals import deep_equals
 from sktime.utils.dependencies import _check_soft_dependencies
 from sktime.utils.random_state import set_random_state
-from sktime.utils.sampling import random_partition
 
 # whether to subsample estimators per os/version partition matrix design
 # default is False, can be set to True by pytest --matrixdesign True flag
@@ -65,6 +56,9 @@ CYTHON_ESTIMATORS = False
 # default is False, can be set to True by pytest --only_changed_modules True flag
 ONLY_CHANGED_MODULES = False
 
+# set of array-like non-state-changing methods, for fast membership checks
+_NSC_ARRAYLIKE = frozenset(NON_STATE_CHANGING_METHODS_ARRAYLIKE)
+
 
 def subsample_by_version_os(x):
     """Subsample objects by operating system and python version.
@@ -73,9 +67,14 @@ def subsample_by_version_os(x):
     combined with a matrix of OS/versions.
 
     Currently assumes that matrix includes py3.8-3.10, and win/ubuntu/mac.
+
+    Objects are assigned to partitions by a checksum of their name, so the
+    assignment is deterministic across processes, does not change when other
+    objects are added or removed, and does not reseed the global random state.
     """
     import platform
     import sys
+    import zlib
 
     ix = sys.version_info.minor % 3
     os_str = platform.system()
@@ -89,13 +88,244 @@ def subsample_by_version_os(x):
         raise ValueError(f"found unexpected OS string: {os_str}")
     ix = ix % 3
 
-    part = random_partition(len(x), 3)
-    subset_idx = part[ix]
-    res = [x[i] for i in subset_idx]
+    res = [est for est in x if zlib.crc32(est.__name__.encode()) % 3 == ix]
 
     return res
 
 
+@lru_cache
+def _all_estimators_cached(
+    estimator_types=None,
+    matrixdesign=False,
+    cython_estimators=False,
+    only_changed_modules=False,
+):
+    """Retrieve tuple of all estimator classes to test, cached version.
+
+    The flags are passed explicitly, rather than read from the module level
+    variables, so they become part of the cache key.
+
+    Parameters
+    ----------
+    estimator_types : None, str, or tuple of str, optional (default=None)
+        which estimator types to retrieve, passed to ``all_estimators``
+    matrixdesign : bool, optional (default=False)
+        whether to subsample estimators by os/version partition matrix design
+    cython_estimators : bool, optional (default=False)
+        whether to retrieve only estimators that require cython
+    only_changed_modules : bool, optional (default=False)
+        value of ``ONLY_CHANGED_MODULES``, used by ``run_test_for_class``
+
+    Returns
+    -------
+    est_list : tuple of estimator classes to test
+    """
+    if cython_estimators:
+        filter_tags = {"requires_cython": True}
+    else:
+        filter_tags = None
+
+    if isinstance(estimator_types, tuple):
+        estimator_types = list(estimator_types)
+
+    est_list = all_estimators(
+        estimator_types=estimator_types,
+        return_names=False,
+        exclude_estimators=EXCLUDE_ESTIMATORS,
+        filter_tags=filter_tags,
+    )
+    # subsample estimators by OS & python version
+    # this ensures that only a 1/3 of estimators are tested for a given combination
+    # but all are tested on every OS at least once, and on every python version once
+    if matrixdesign:
+        est_list = subsample_by_version_os(est_list)
+
+    # run_test_for_class selects the estimators to run
+    # based on whether they have changed, and whether they have all dependencies
+    # internally, uses the ONLY_CHANGED_MODULES flag,
+    # and checks the python env against python_dependencies tag
+    est_list = [est for est in est_list if run_test_for_class(est)]
+
+    return tuple(est_list)
+
+
+@lru_cache
+def _retrieve_scenarios_cached(obj):
+    """Retrieve test scenarios for a class or scitype string, cached version.
+
+    Parameters
+    ----------
+    obj : class inheriting from BaseObject, or scitype string
+        passed to ``retrieve_scenarios``
+
+    Returns
+    -------
+    scenarios : tuple of objects, instances of BaseScenario
+    """
+    return tuple(retrieve_scenarios(obj))
+
+
+@lru_cache
+def _nsc_capabilities(cls):
+    """Retrieve non-state-changing methods an estimator class has, cached version.
+
+    Parameters
+    ----------
+    cls : estimator class, inheriting from BaseObject
+
+    Returns
+    -------
+    tuple of str, names of methods in ``NON_STATE_CHANGING_METHODS`` that ``cls``
+        has capability of, as per ``_has_capability``, in the same order
+    """
+    return tuple(x for x in NON_STATE_CHANGING_METHODS if _has_capability(cls, x))
+
+
+@lru_cache
+def _create_test_instances_cached(cls):
+    """Create test instances and names for estimator class, cached version.
+
+    The instances are shared between tests, and must not be mutated by callers.
+    In tests, the indirect ``estimator_instance`` fixture clones them.
+
+    Parameters
+    ----------
+    cls : estimator class, inheriting from BaseObject
+
+    Returns
+    -------
+    instances : tuple of instances of cls, from ``create_test_instances_and_names``
+    names : tuple of str, names of instances, from ``create_test_instances_and_names``
+    """
+    instances, names = cls.create_test_instances_and_names()
+    return tuple(instances), tuple(names)
+
+
+def _is_value_param(obj):
+    """Check whether obj is a parameter value that can be compared by value.
+
+    Parameters
+    ----------
+    obj : any object, e.g., value of a parameter of an estimator
+
+    Returns
+    -------
+    bool, whether obj is a primitive, numpy scalar of numeric or boolean dtype,
+        numpy array of numeric, boolean or datetime dtype,
+        pandas DataFrame or Series, or list, tuple or dict of such objects.
+        Such objects have no state beyond their value, and are compared by
+        deep_equals in tests, while other objects are compared by joblib.hash.
+    """
+    # datetime and timedelta scalars are excluded, deep_equals has NaT != NaT
+    # this is checked first, since np.timedelta64 is a numbers.Number
+    if isinstance(obj, np.generic):
+        return obj.dtype.kind in "biufc"
+    if obj is None or isinstance(obj, (str, bytes, numbers.Number)):
+        return True
+    if isinstance(obj, (pd.DataFrame, pd.Series)):
+        return True
+    # string and bytes arrays are excluded, deep_equals does not support them
+    if isinstance(obj, np.ndarray):
+        return obj.dtype.kind in "biufcmM"
+    if isinstance(obj, (list, tuple)):
+        return all(_is_value_param(x) for x in obj)
+    if isinstance(obj, dict):
+        return all(_is_value_param(x) for x in obj.values())
+    return False
+
+
+def _has_custom_serialization(estimator):
+    """Check whether estimator or a component overrides default serialization.
+
+    Objects with custom ``__getstate__``, ``save`` or ``load_from_serial``, e.g.,
+    deep learners, may drop fitted state when deepcopied, without raising.
+
+    Parameters
+    ----------
+    estimator : estimator instance, inheriting from BaseObject
+
+    Returns
+    -------
+    bool, whether estimator, or any BaseObject among its nested parameters,
+        is of a class that overrides ``__getstate__``, ``save`` or
+        ``load_from_serial`` of BaseObject
+    """
+
+    # static lookup, as object.__getstate__ only exists from python 3.11 on
+    def _is_custom(obj):
+        cls = type(obj)
+        methods = ["__getstate__", "save", "load_from_serial"]
+        return any(
+            getattr_static(cls, x, None) is not getattr_static(BaseObject, x, None)
+            for x in methods
+        )
+
+    objs = [estimator] + list(estimator.get_params(deep=True).values())
+    return any(_is_custom(obj) for obj in objs if isinstance(obj, BaseObject))
+
+
+# cache of fitted estimators, used in _fit_cached
+# keys are (estimator class, scenario class, joblib.hash of unfitted estimator),
+# values are fitted estimators. Only estimators of one class are kept at a time,
+# the cache is cleared when _fit_cached is called with an estimator of another class.
+_FITTED_ESTIMATOR_CACHE = dict()
+
+
+def _fit_cached(estimator, scenario):
+    """Fit estimator in scenario, or return copy of cached fitted estimator.
+
+    For use in tests that require a fitted estimator, but do not test fit itself.
+    Fitted estimators are cached by scenario class and joblib.hash of the
+    unfitted estimator, i.e., its parameters, including the random state, config
+    and tags. Callers should call set_random_state before, as when fitting.
+
+    Estimators with custom serialization, see ``_has_custom_serialization``,
+    are not cached, since a deepcopy of them need not be a valid fitted estimator.
+
+    Parameters
+    ----------
+    estimator : unfitted estimator instance, inheriting from BaseEstimator
+    scenario : instance of TestScenario, used to fit estimator
+
+    Returns
+    -------
+    fitted estimator : estimator, fitted in scenario, if not in cache;
+        otherwise a deepcopy of the cached fitted estimator.
+        If estimator cannot be cached, estimator, fitted without cache.
+    """
+    if not _check_soft_dependencies("joblib", severity="none"):
+        return scenario.run(estimator, method_sequence=["fit"])
+
+    if _has_custom_serialization(estimator):
+        return scenario.run(estimator, method_sequence=["fit"])
+
+    from joblib import hash
+
+    try:
+        key = (type(estimator), type(scenario), hash(estimator))
+    except Exception:
+        return scenario.run(estimator, method_sequence=["fit"])
+
+    # bound the cache to one estimator class, all keys share the same class
+    # consecutive calls within a test function are mostly for the same class
+    if _FITTED_ESTIMATOR_CACHE and next(iter(_FITTED_ESTIMATOR_CACHE))[0] is not key[0]:
+        _FITTED_ESTIMATOR_CACHE.clear()
+
+    if key in _FITTED_ESTIMATOR_CACHE:
+        return deepcopy(_FITTED_ESTIMATOR_CACHE[key])
+
+    fitted_estimator = scenario.run(estimator, method_sequence=["fit"])
+
+    # the copy is cached, as the caller may change the state of fitted_estimator
+    try:
+        cached_estimator = deepcopy(fitted_estimator)
+    except Exception:
+        return fitted_estimator
+
+    _FITTED_ESTIMATOR_CACHE[key] = cached_estimator
+    return fitted_estimator
+
+
 class ValidProbaErrors:
     """Context manager, returns None on valid predict_proba or skpro exception."""
 
@@ -205,6 +435,10 @@ class BaseFixtureGenerator:
         #   this is intersection of self.indirect_vixtures with args in fixture_vars
         indirect_vars = list(set(fixture_vars).intersection(self.indirect_fixtures))
 
+        # group all fixtures of the same estimator for pytest-xdist --dist loadgroup
+        #   so all tests of one estimator run on the same worker
+        fixture_prod = self._xdist_group_fixtures(fixture_param_str, fixture_prod)
+
         metafunc.parametrize(
             fixture_param_str,
             fixture_prod,
@@ -212,32 +446,64 @@ class BaseFixtureGenerator:
             indirect=indirect_vars,
         )
 
-    def _all_estimators(self):
-        """Retrieve list of all estimator classes of type self.estimator_type_filter."""
-        if CYTHON_ESTIMATORS:
-            filter_tags = {"requires_cython": True}
-        else:
-            filter_tags = None
+    @staticmethod
+    def _xdist_group_fixtures(fixture_param_str, fixture_prod):
+        """Mark fixtures with xdist_group named after the estimator they contain.
 
-        est_list = all_estimators(
-            estimator_types=getattr(self, "estimator_type_filter", None),
-            return_names=False,
-            exclude_estimators=EXCLUDE_ESTIMATORS,
-            filter_tags=filter_tags,
-        )
-        # subsample estimators by OS & python version
-        # this ensures that only a 1/3 of estimators are tested for a given combination
-        # but all are tested on every OS at least once, and on every python version once
-        if MATRIXDESIGN:
-            est_list = subsample_by_version_os(est_list)
+        Parameters
+        ----------
+        fixture_param_str : str, fixture variable names, separated by ","
+        fixture_prod : list of fixtures, as returned by
+            create_conditional_fixtures_and_names
 
-        # run_test_for_class selects the estimators to run
-        # based on whether they have changed, and whether they have all dependencies
-        # internally, uses the ONLY_CHANGED_MODULES flag,
-        # and checks the python env against python_dependencies tag
-        est_list = [est for est in est_list if run_test_for_class(est)]
+        Returns
+        -------
+        list of fixtures, elements are pytest.param wrapping the elements of
+            fixture_prod, with xdist_group mark named after estimator class name,
+            if fixture_param_str contains estimator_class or estimator_instance;
+            otherwise fixture_prod, unaltered
+        """
+        fixture_vars = fixture_param_str.split(",")
 
-        return est_list
+        if "estimator_class" in fixture_vars:
+            est_ix = fixture_vars.index("estimator_class")
+        elif "estimator_instance" in fixture_vars:
+            est_ix = fixture_vars.index("estimator_instance")
+        else:
+            return fixture_prod
+
+        def _group_name(fixture):
+            # pytest convention: single fixture variables are not wrapped in tuples
+            est = fixture[est_ix] if len(fixture_vars) > 1 else fixture
+            if not isclass(est):
+                est = type(est)
+            return est.__name__
+
+        def _param(fixture):
+            if len(fixture_vars) > 1:
+                values = fixture
+            else:
+                values = (fixture,)
+            mark = pytest.mark.xdist_group(name=_group_name(fixture))
+            return pytest.param(*values, marks=mark)
+
+        return [_param(fixture) for fixture in fixture_prod]
+
+    def _all_estimators(self):
+        """Retrieve list of all estimator classes of type self.estimator_type_filter."""
+        estimator_types = getattr(self, "estimator_type_filter", None)
+        # lists are not hashable, so we convert to tuple for the cache key
+        if isinstance(estimator_types, list):
+            estimator_types = tuple(estimator_types)
+
+        est_list = _all_estimators_cached(
+            estimator_types=estimator_types,
+            matrixdesign=MATRIXDESIGN,
+            cython_estimators=CYTHON_ESTIMATORS,
+            only_changed_modules=ONLY_CHANGED_MODULES,
+        )
+        # copy the result to avoid modifying the cached result
+        return list(est_list)
 
     def generator_dict(self):
         """Return dict with methods _generate_[variable] collected in a dict.
@@ -280,14 +546,59 @@ class BaseFixtureGenerator:
         estimator_class: estimator inheriting from BaseObject
             ranges over all estimator classes not excluded by EXCLUDED_TESTS
         """
-        estimator_classes_to_test = [
+        estimator_classes_to_test, estimator_names = self._estimator_classes_to_test(
+            test_name=test_name
+        )
+
+        # test_dl_constructor_initializes_deeply applies only to deep learners,
+        # so other classes are not collected for it
+        if test_name == "test_dl_constructor_initializes_deeply":
+            from sktime.classification.deep_learning.base import BaseDeepClassifier
+            from sktime.regression.deep_learning.base import BaseDeepRegressor
+
+            dl_bases = (BaseDeepClassifier, BaseDeepRegressor)
+            is_dl = [issubclass(est, dl_bases) for est in estimator_classes_to_test]
+            estimator_classes_to_test = [
+                est for est, dl in zip(estimator_classes_to_test, is_dl) if dl
+            ]
+            estimator_names = [name for name, dl in zip(estimator_names, is_dl) if dl]
+
+        return list(estimator_classes_to_test), list(estimator_names)
+
+    def _estimator_classes_to_test(self, test_name):
+        """Return estimator classes and names to test in test_name, cached per test.
+
+        Shared by _generate_estimator_class and _generate_estimator_instance,
+        so the estimator classes are filtered only once per test_name.
+
+        Parameters
+        ----------
+        test_name : str
+            name of the test that estimator classes are retrieved for,
+            used to exclude estimators via EXCLUDED_TESTS
+
+        Returns
+        -------
+        estimator_classes_to_test : tuple of estimator classes
+            all estimator classes not excluded by EXCLUDED_TESTS for test_name
+        estimator_names : tuple of str, names of classes in estimator_classes_to_test
+        """
+        # lazy attribute, since pytest test classes cannot define __init__
+        if not hasattr(self, "_class_cache"):
+            self._class_cache = dict()
+
+        if test_name in self._class_cache:
+            return self._class_cache[test_name]
+
+        estimator_classes_to_test = tuple(
             est
             for est in self._all_estimators()
             if not self.is_excluded(test_name, est)
-        ]
+        )
 
-        estimator_names = [est.__name__ for est in estimator_classes_to_test]
+        estimator_names = tuple(est.__name__ for est in estimator_classes_to_test)
 
+        self._class_cache[test_name] = (estimator_classes_to_test, estimator_names)
         return estimator_classes_to_test, estimator_names
 
     def _generate_estimator_instance(self, test_name, **kwargs):
@@ -299,8 +610,8 @@ class BaseFixtureGenerator:
             ranges over all estimator classes not excluded by EXCLUDED_TESTS
             instances are generated by create_test_instance class method
         """
-        # call _generate_estimator_class to get all the classes
-        estimator_classes_to_test, _ = self._generate_estimator_class(
+        # retrieve all the classes, shared with _generate_estimator_class
+        estimator_classes_to_test, _ = self._estimator_classes_to_test(
             test_name=test_name
         )
 
@@ -308,8 +619,9 @@ class BaseFixtureGenerator:
         estimator_instances_to_test = []
         estimator_instance_names = []
         # retrieve all estimator parameters if multiple, construct instances
+        # instances are cached per class, the estimator_instance fixture clones them
         for est in estimator_classes_to_test:
-            all_instances_of_est, instance_names = est.create_test_instances_and_names()
+            all_instances_of_est, instance_names = _create_test_instances_cached(est)
             estimator_instances_to_test += all_instances_of_est
             estimator_instance_names += instance_names
 
@@ -339,7 +651,13 @@ class BaseFixtureGenerator:
         else:
             return []
 
-        scenarios = retrieve_scenarios(obj)
+        if isclass(obj):
+            scenarios = list(_retrieve_scenarios_cached(obj))
+        else:
+            # applicability of scenarios may depend on dynamic tags of obj,
+            # so only the scenarios for the scitype of obj are cached
+            scenarios = _retrieve_scenarios_cached(scitype(obj))
+            scenarios = [s for s in scenarios if s.is_applicable(obj)]
         scenarios = [s for s in scenarios if not self._excluded_scenario(test_name, s)]
         scenario_names = [type(scen).__name__ for scen in scenarios]
 
@@ -391,11 +709,13 @@ class BaseFixtureGenerator:
         else:
             return []
 
-        # complete list of all non-state-changing methods
-        nsc_list = NON_STATE_CHANGING_METHODS
-
-        # subset to the methods that x has implemented
-        nsc_list = [x for x in nsc_list if _has_capability(obj, x)]
+        # subset all non-state-changing methods to the methods that x has implemented
+        # capabilities of instances may depend on dynamic tags, so are not cached
+        if isclass(obj):
+            nsc_list = list(_nsc_capabilities(obj))
+        else:
+            nsc_list = NON_STATE_CHANGING_METHODS
+            nsc_list = [x for x in nsc_list if _has_capability(obj, x)]
 
         return nsc_list
 
@@ -411,10 +731,9 @@ class BaseFixtureGenerator:
         method_nsc_list = self._generate_method_nsc(test_name=test_name, **kwargs)
 
         # subset to the arraylike ones to avoid copy-paste
-        nsc_list_arraylike = set(method_nsc_list).intersection(
-            NON_STATE_CHANGING_METHODS_ARRAYLIKE
-        )
-        return list(nsc_list_arraylike)
+        # this preserves the order of method_nsc_list, so that the order of
+        # collected tests does not depend on string hashing, e.g., across workers
+        return [x for x in method_nsc_list if x in _NSC_ARRAYLIKE]
 
 
 class QuickTester:
@@ -1253,6 +1572,11 @@ class TestAllEstimators(BaseFixtureGenerator, QuickTester):
         ------
         Exception if NotFittedError is not raised by non-state changing method
         """
+        from sktime.dists_kernels.base import (
+            BasePairwiseTransformer,
+            BasePairwiseTransformerPanel,
+        )
+
         # pairwise transformers are exempted from this test, since they have no fitting
         PWTRAFOS = (BasePairwiseTransformer, BasePairwiseTransformerPanel)
         excepted = isinstance(estimator_instance, PWTRAFOS)
@@ -1265,6 +1589,8 @@ class TestAllEstimators(BaseFixtureGenerator, QuickTester):
 
     def test_fit_idempotent(self, estimator_instance, scenario, method_nsc_arraylike):
         """Check that calling fit twice is equivalent to calling it once."""
+        from sktime.forecasting.base import BaseForecaster
+
         estimator = estimator_instance
 
         # for now, we have to skip predict_proba, since current output comparison
@@ -1276,6 +1602,7 @@ class TestAllEstimators(BaseFixtureGenerator, QuickTester):
             return None
 
         # run fit plus method_nsc once, save results
+        # returns are not deepcopied, as the fitted estimator is re-fitted below
         set_random_state(estimator)
         if method_nsc_arraylike in ["predict_proba", "predict_var"]:
             with ValidProbaErrors() as handler:
@@ -1283,7 +1610,6 @@ class TestAllEstimators(BaseFixtureGenerator, QuickTester):
                     estimator,
                     method_sequence=["fit", method_nsc_arraylike],
                     return_all=True,
-                    deepcopy_return=True,
                 )
             if handler.skipped:
                 return None
@@ -1292,9 +1618,12 @@ class TestAllEstimators(BaseFixtureGenerator, QuickTester):
                 estimator,
                 method_sequence=["fit", method_nsc_arraylike],
                 return_all=True,
-                deepcopy_return=True,
             )
 
+        # snapshot only the output, in case it is a reference to estimator state
+        # which the second fit changes in place
+        result_1st = deepcopy(results[1])
+
         estimator = results[0]
         set_random_state(estimator)
 
@@ -1303,13 +1632,14 @@ class TestAllEstimators(BaseFixtureGenerator, QuickTester):
             estimator,
             method_sequence=["fit", method_nsc_arraylike],
             return_all=True,
-            deepcopy_return=True,
         )
 
+        result_2nd = results_2nd[1]
+
         # check results are equal
         _assert_array_almost_equal(
-            results[1],
-            results_2nd[1],
+            result_1st,
+            result_2nd,
             # err_msg=f"Idempotency check failed for method {method}",
         )
 
@@ -1318,36 +1648,67 @@ class TestAllEstimators(BaseFixtureGenerator, QuickTester):
         estimator = estimator_instance
         set_random_state(estimator)
 
-        # Make a physical copy of the original estimator parameters before fitting.
+        joblib_available = _check_soft_dependencies("joblib", severity="none")
+        if joblib_available:
+            from joblib import hash
+
+        # Snapshot the original estimator parameters before fitting.
+        # Plain values are copied, all other objects are hashed,
+        # to avoid a full deep copy of nested estimators.
         params = estimator.get_params()
-        original_params = deepcopy(params)
+        original_params = dict()
+        original_hashes = dict()
+        for param_name, value in params.items():
+            if _is_value_param(value):
+                original_params[param_name] = deepcopy(value)
+            elif joblib_available:
+                original_hashes[param_name] = hash(value)
 
         # Fit the model
         fitted_est = scenario.run(estimator_instance, method_sequence=["fit"])
 
         # Compare the state of the model parameters with the original parameters
         new_params = fitted_est.get_params()
+
+        # joblib.hash has problems with pandas objects, so we use deep_equals then
+        # for other plain values, deep_equals is a cheaper value comparison.
         for param_name, original_value in original_params.items():
             new_value = new_params[param_name]
 
-            # We should never change or mutate the internal state of input
-            # parameters by default. To check this we use the joblib.hash function
-            # that introspects recursively any subobjects to compute a checksum.
-            # The only exception to this rule of immutable constructor parameters
-            # is possible RandomState instance but in this check we explicitly
-            # fixed the random_state params recursively to be integer seeds.
+            is_equal, equals_msg = deep_equals(
+                new_value, original_value, return_msg=True
+            )
             msg = (
                 "Estimator %s should not change or mutate "
-                " the parameter %s from %s to %s during fit."
-                % (estimator.__class__.__name__, param_name, original_value, new_value)
+                " the parameter %s from %s to %s during fit. "
+                "Reason for discrepancy: %s"
+                % (
+                    estimator.__class__.__name__,
+                    param_name,
+                    original_value,
+                    new_value,
+                    equals_msg,
+                )
             )
-            # joblib.hash has problems with pandas objects, so we use deep_equals then
-            if isinstance(original_value, (pd.DataFrame, pd.Series)):
-                assert deep_equals(new_value, original_value), msg
-            elif _check_soft_dependencies("joblib", severity="none"):
-                from joblib import hash
+            assert is_equal, msg
 
-                assert hash(new_value) == hash(original_value), msg
+        # We should never change or mutate the internal state of input
+        # parameters by default. To check this we use the joblib.hash function
+        # that introspects recursively any subobjects to compute a checksum.
+        # The only exception to this rule of immutable constructor parameters
+        # is possible RandomState instance but in this check we explicitly
+        # fixed the random_state params recursively to be integer seeds.
+        # Other objects, e.g., estimators, can be mutated in place without
+        # changing their __eq__, so we compare them via joblib.hash
+        for param_name, original_hash in original_hashes.items():
+            new_value = new_params[param_name]
+
+            msg = (
+                "Estimator %s should not change or mutate "
+                " the parameter %s during fit, found %s after fit."
+                % (estimator.__class__.__name__, param_name, new_value)
+            )
+            assert hash(new_value) == original_hash, msg
 
     def test_non_state_changing_method_contract(
         self, estimator_instance, scenario, method_nsc
@@ -1366,22 +1727,36 @@ class TestAllEstimators(BaseFixtureGenerator, QuickTester):
         set_random_state(estimator)
 
         # dict_before = copy of dictionary of estimator before predict, post fit
-        _ = scenario.run(estimator, method_sequence=["fit"])
+        estimator = _fit_cached(estimator, scenario)
         dict_before = estimator.__dict__.copy()
 
         # skip test if vectorization would be necessary and method predict_proba
         # this is since vectorization is not implemented for predict_proba
         if method_nsc in ["predict_proba", "predict_var"]:
             with ValidProbaErrors() as handler:
-                scenario.run(estimator, method_sequence=[method_nsc])
+                output = scenario.run(estimator, method_sequence=[method_nsc])
             if handler.skipped:
                 return None
+        else:
+            output = scenario.run(estimator, method_sequence=[method_nsc])
 
         # dict_after = dictionary of estimator after predict and fit
-        output = scenario.run(estimator, method_sequence=[method_nsc])
         dict_after = estimator.__dict__
 
-        is_equal, msg = deep_equals(dict_after, dict_before, return_msg=True)
+        # dict_before is a shallow copy, so attributes still referencing the same
+        # object are unchanged; only the remaining attributes need deep comparison
+        changed_after = {
+            key: value
+            for key, value in dict_after.items()
+            if key not in dict_before or value is not dict_before[key]
+        }
+        changed_before = {
+            key: value
+            for key, value in dict_before.items()
+            if key not in dict_after or value is not dict_after[key]
+        }
+
+        is_equal, msg = deep_equals(changed_after, changed_before, return_msg=True)
         assert is_equal, (
             f"Estimator: {type(estimator).__name__} changes __dict__ "
             f"during {method_nsc}, "
@@ -1430,16 +1805,18 @@ class TestAllEstimators(BaseFixtureGenerator, QuickTester):
 
         # skip test if vectorization would be necessary and method predict_proba
         # this is since vectorization is not implemented for predict_proba
+        # Run the method, get args before and after
         if method_nsc in ["predict_proba", "predict_var"]:
             with ValidProbaErrors() as handler:
-                scenario.run(estimator, method_sequence=[method_nsc])
+                _, args_after = scenario.run(
+                    estimator, method_sequence=[method_nsc], return_args=True
+                )
             if handler.skipped:
                 return None
-
-        # Fit the model, get args before and after
-        _, args_after = scenario.run(
-            estimator, method_sequence=[method_nsc], return_args=True
-        )
+        else:
+            _, args_after = scenario.run(
+                estimator, method_sequence=[method_nsc], return_args=True
+            )
         method_args_after = args_after[0]
         method_args_before = scenario.get_args(method_nsc, estimator)
 
@@ -1451,6 +1828,9 @@ class TestAllEstimators(BaseFixtureGenerator, QuickTester):
         self, estimator_instance, scenario, method_nsc_arraylike
     ):
         """Check that we can pickle all estimators."""
+        from sktime.classification.deep_learning.base import BaseDeepClassifier
+        from sktime.regression.deep_learning.base import BaseDeepRegressor
+
         method_nsc = method_nsc_arraylike
         estimator = estimator_instance
         is_forecaster = scitype(estimator) == "forecaster"
@@ -1471,8 +1851,8 @@ class TestAllEstimators(BaseFixtureGenerator, QuickTester):
             return None
 
         set_random_state(estimator)
-        # Fit the model, get args before and after
-        scenario.run(estimator, method_sequence=["fit"], return_args=True)
+        # Fit the model, or retrieve a copy of the fitted model from the cache
+        estimator = _fit_cached(estimator, scenario)
 
         # Generate results before pickling
         vanilla_result = scenario.run(estimator, method_sequence=[method_nsc])
@@ -1500,6 +1880,9 @@ class TestAllEstimators(BaseFixtureGenerator, QuickTester):
         self, estimator_instance, scenario, method_nsc_arraylike
     ):
         """Check if saved estimators onto disk can be loaded correctly."""
+        import os
+        from tempfile import TemporaryDirectory
+
         method_nsc = method_nsc_arraylike
         estimator = estimator_instance
         is_forecaster = scitype(estimator) == "forecaster"
@@ -1514,8 +1897,8 @@ class TestAllEstimators(BaseFixtureGenerator, QuickTester):
             return None
 
         set_random_state(estimator)
-        # Fit the model, get args before and after
-        scenario.run(estimator, method_sequence=["fit"], return_args=True)
+        # Fit the model, or retrieve a copy of the fitted model from the cache
+        estimator = _fit_cached(estimator, scenario)
 
         # Generate results before saving
         vanilla_result = scenario.run(estimator, method_sequence=[method_nsc])
@@ -1567,23 +1950,26 @@ class TestAllEstimators(BaseFixtureGenerator, QuickTester):
         if is_forecaster and method_nsc == "predict_var" and not skpro_available:
             return None
 
+        # fitted estimators are cached per n_jobs setting, via _fit_cached,
+        # so each is fitted only once across the methods tested in the scenario.
+        # Estimators with custom serialization, e.g., deep learners, are not cached
+        # by _fit_cached, and are fitted anew for every method.
+
         # run on a single process
         # -----------------------
-        estimator = deepcopy(estimator_instance)
+        estimator = estimator_instance.clone()
         estimator.set_params(n_jobs=1)
         set_random_state(estimator)
-        result_single_process = scenario.run(
-            estimator, method_sequence=["fit", method_nsc]
-        )
+        estimator = _fit_cached(estimator, scenario)
+        result_single_process = scenario.run(estimator, method_sequence=[method_nsc])
 
         # run on multiple processes
         # -------------------------
-        estimator = deepcopy(estimator_instance)
+        estimator = estimator_instance.clone()
         estimator.set_params(n_jobs=-1)
         set_random_state(estimator)
-        result_multiple_process = scenario.run(
-            estimator, method_sequence=["fit", method_nsc]
-        )
+        estimator = _fit_cached(estimator, scenario)
+        result_multiple_process = scenario.run(estimator, method_sequence=[method_nsc])
 
         _assert_array_equal(
             result_single_process,
@@ -1593,14 +1979,16 @@ class TestAllEstimators(BaseFixtureGenerator, QuickTester):
 
     def test_dl_constructor_initializes_deeply(self, estimator_class):
         """Test DL estimators that they pass custom parameters to underlying Network."""
+        from sktime.classification.deep_learning.base import BaseDeepClassifier
+        from sktime.regression.deep_learning.base import BaseDeepRegressor
+
         estimator = estimator_class
 
+        # only deep learners are collected for this test, but check_estimator
+        # runs all tests on the estimator it is passed
         if not issubclass(estimator, (BaseDeepClassifier, BaseDeepRegressor)):
             return None
 
-        if not hasattr(estimator, "get_test_params"):
-            return None
-
         params = estimator.get_test_params()
 
         if isinstance(params, list):
@@ -1615,9 +2003,13 @@ class TestAllEstimators(BaseFixtureGenerator, QuickTester):
 
         estimator = estimator(**params)
 
+        est_vars = vars(estimator)
+        net_vars = vars(estimator._network)
+
         for key, value in params.items():
-            assert vars(estimator)[key] == value
+            assert est_vars[key] == value
             # some keys are only relevant to the final model (eg: n_epochs)
             # skip them for the underlying network
-            if vars(estimator._network).get(key) is not None:
-                assert vars(estimator._network)[key] == value
+            net_value = net_vars.get(key)
+            if net_value is not None:
+                assert net_value == value